@@ -13,24 +13,33 @@ Features:
 The code aims to be readable and straightforward.
 """
 
+import io
 import os
 import csv
 import sys
+import functools
+from collections import defaultdict
 from pathlib import Path
 
-# When this file is run directly (or imported by runpy), Python may not
-# find sibling modules unless the folder is on sys.path. Try a normal
-# import first; if it fails, add the file directory to sys.path and
-# import again. This makes the import more robust for testing.
 try:
-    from resources import RESOURCES, FOODS, BUILDINGS, sample_project
-    from utils import safe_int, print_table, save_project, load_project, time_stamp
-except Exception:
+    import numpy as np
+except ImportError:  # only needed by the batch helpers below
+    np = None
+
+# When this file is run directly (or imported by runpy), Python may not
+# find sibling modules unless the folder is on sys.path. Outside a
+# package, add the file directory to sys.path before importing them.
+# This makes the import more robust for testing.
+if __package__ in (None, ""):
     this_dir = str(Path(__file__).resolve().parent)
     if this_dir not in sys.path:
         sys.path.insert(0, this_dir)
-    from resources import RESOURCES, FOODS, BUILDINGS, sample_project
-    from utils import safe_int, print_table, save_project, load_project, time_stamp
+
+from resources import (
+    FOODS, BUILDINGS, RESOURCE_NAMES, RESOURCE_UNITS, BUILDING_COSTS,
+    BUILDING_INDEX, COST_MATRIX, sample_project,
+)
+from utils import safe_int, print_table, save_project, load_project, time_stamp
 
 
 def compute_requirements(duplicants, days, food_key, buildings):
@@ -42,7 +51,28 @@ def compute_requirements(duplicants, days, food_key, buildings):
     - food_key: key from FOODS dictionary
     - buildings: dict of building_key -> count
 
-    Returns a dict with totals for food and materials.
+    Returns a dict with totals for food and materials. The
+    "material_rows" entry lists the materials as (name, qty, unit)
+    tuples, ready for the summary and CSV output.
+
+    Results are cached, so running the same project again is cheap.
+    The caller gets its own copy and may change it freely.
+    """
+    cached = _compute_cached(duplicants, days, food_key, tuple(buildings.items()))
+    return {
+        **cached,
+        "food": dict(cached["food"]),
+        "materials": dict(cached["materials"]),
+        "material_rows": list(cached["material_rows"]),
+    }
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _compute_cached(duplicants, days, food_key, building_items):
+    """Cached worker for compute_requirements.
+
+    building_items is a tuple of (building_key, count) pairs so the
+    arguments can be used as a cache key.
     """
     if food_key not in FOODS:
         raise ValueError("Unknown food: " + str(food_key))
@@ -56,67 +86,117 @@ def compute_requirements(duplicants, days, food_key, buildings):
     total_calories_needed = duplicants * days * calories_per_duplicant_per_day
 
     # Compute how many food units we need (round up)
-    units_needed = total_calories_needed // calories_per_unit
-    if total_calories_needed % calories_per_unit:
-        units_needed += 1
+    units_needed = -(-total_calories_needed // calories_per_unit)
 
     # Building material totals
-    materials = {}
-    for bkey, count in buildings.items():
-        info = BUILDINGS.get(bkey)
-        if not info:
-            # skip unknown building keys but continue
-            continue
-        for res_key, qty in info.items():
-            if res_key == "name":
-                continue
-            materials[res_key] = materials.get(res_key, 0) + qty * count
+    materials = defaultdict(int)
+    for bkey, count in building_items:
+        # unknown building keys have no costs and are skipped
+        for res_key, qty in BUILDING_COSTS.get(bkey, ()):
+            materials[res_key] += qty * count
 
     return {
         "duplicants": duplicants,
         "days": days,
-        "food": {"key": food_key, "units": units_needed, "unit": food_info.get("unit")},
-        "materials": materials,
+        "food": {
+            "key": food_key,
+            "name": food_info["name"],
+            "units": units_needed,
+            "unit": food_info.get("unit"),
+        },
+        "materials": dict(materials),
+        "material_rows": [
+            (RESOURCE_NAMES.get(mat, mat), qty, RESOURCE_UNITS.get(mat, "units"))
+            for mat, qty in materials.items()
+        ],
     }
 
 
+def building_counts_vector(buildings):
+    """Turn a dict of building_key -> count into a NumPy count vector.
+
+    The vector is ordered like BUILDING_INDEX. Unknown building keys
+    are ignored, the same as in compute_requirements. NumPy picks the
+    dtype, so fractional counts stay fractional instead of being
+    truncated.
+    """
+    if COST_MATRIX is None:
+        raise ImportError("NumPy is required for building_counts_vector")
+    return np.array([buildings.get(bkey, 0) for bkey in BUILDING_INDEX])
+
+
+def compute_materials_np(counts):
+    """Compute material totals for one or many projects with NumPy.
+
+    counts is either a 1-D vector of building counts (see
+    building_counts_vector) or a 2-D array with one project per row.
+    Returns the totals ordered like RESOURCE_INDEX, one row per
+    project for 2-D input. Integer counts give integer totals; float
+    counts are not truncated and give float totals, matching
+    compute_requirements.
+    """
+    if COST_MATRIX is None:
+        raise ImportError("NumPy is required for compute_materials_np")
+    return np.asarray(counts) @ COST_MATRIX
+
+
 def format_summary(requirements):
     """Return a short printable summary (list of rows) for print_table."""
-    rows = []
-    rows.append(["Duplicants", requirements["duplicants"]])
-    rows.append(["Days", requirements["days"]])
-
     food = requirements["food"]
-    rows.append(["Food item", FOODS[food["key"]]["name"]])
-    rows.append(["Food units needed", f"{food['units']} {food['unit']}"])
+    rows = [
+        ["Duplicants", requirements["duplicants"]],
+        ["Days", requirements["days"]],
+        ["Food item", food["name"]],
+        ["Food units needed", f"{food['units']} {food['unit']}"],
+        ["", ""],  # blank row for spacing
+        ["Material", "Total"],
+    ]
 
     # Add materials
-    rows.append(["", ""])  # blank row for spacing
-    rows.append(["Material", "Total"])
-    for mat, qty in requirements["materials"].items():
-        name = RESOURCES.get(mat, {}).get("name", mat)
-        unit = RESOURCES.get(mat, {}).get("unit", "units")
-        rows.append([name, f"{qty} {unit}"])
+    rows.extend([[name, f"{qty} {unit}"] for name, qty, unit in requirements["material_rows"]])
 
     return rows
 
 
-def save_summary_csv(path, requirements):
-    """Save a minimal CSV with the results so the user can open it in a spreadsheet."""
-    with open(path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(["Duplicants", requirements['duplicants']])
-        writer.writerow(["Days", requirements['days']])
-        writer.writerow([""])
-        food = requirements['food']
-        writer.writerow(["Food item", FOODS[food['key']]['name']])
-        writer.writerow(["Food units needed", f"{food['units']} {food['unit']}"])
-        writer.writerow([""])
-        writer.writerow(["Material", "Total"])
-        for mat, qty in requirements['materials'].items():
-            name = RESOURCES.get(mat, {}).get('name', mat)
-            unit = RESOURCES.get(mat, {}).get('unit', 'units')
-            writer.writerow([name, f"{qty} {unit}"])
+def save_summary_csv(path, requirements, use_csv_module=False):
+    """Save a minimal CSV with the results so the user can open it in a spreadsheet.
+
+    Quantities and units are in separate columns so the totals can be
+    sorted and summed as numbers. Rows are collected in memory first
+    and written to the file in one go.
+
+    The summary values are plain names and numbers, so rows are joined
+    with commas directly. If a value contains a comma, quote or line
+    break (or use_csv_module is True), the csv module is used so the
+    value is quoted correctly.
+    """
+    food = requirements['food']
+    rows = [
+        ["Duplicants", requirements['duplicants']],
+        ["Days", requirements['days']],
+        [""],
+        ["Food item", food['name']],
+        ["Food units needed", food['units'], food['unit']],
+        [""],
+        ["Material", "Total", "Unit"],
+    ]
+    rows.extend(requirements['material_rows'])
+
+    cells = [[str(c) for c in r] for r in rows]
+    if not use_csv_module:
+        use_csv_module = any(ch in c for r in cells for c in r for ch in ',"\r\n')
+
+    if use_csv_module:
+        buf = io.StringIO()
+        csv.writer(buf).writerows(cells)
+        text = buf.getvalue()
+    else:
+        # Match csv.writer's output: \r\n line endings, and a row with
+        # one empty field is written as "" rather than an empty line
+        text = "".join(('""' if r == [""] else ",".join(r)) + "\r\n" for r in cells)
+
+    with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 16) as csvfile:
+        csvfile.write(text)
 
 
 def interactive_create_project():
@@ -6,6 +6,13 @@ items, and buildings. The main calculator imports these values
 and uses them in computations.
 """
 
+import sys
+
+try:
+    import numpy as _np
+except ImportError:  # without NumPy, COST_MATRIX stays None
+    _np = None
+
 # Basic resource definitions. Each resource has a 'name',
 # an optional unit, and a short description. Values are
 # illustrative rather than game-accurate.
@@ -35,16 +42,54 @@ BUILDINGS = {
     "water_pump": {"name": "Water Pump", "iron_ore": 40},
 }
 
+# Intern every key so lookups with the same text can match on
+# identity. Keys written as identifiers in source are interned by
+# Python already; this makes it hold for any key spelling.
+RESOURCES = {sys.intern(k): v for k, v in RESOURCES.items()}
+FOODS = {sys.intern(k): v for k, v in FOODS.items()}
+BUILDINGS = {
+    sys.intern(k): {sys.intern(res_key): qty for res_key, qty in v.items()}
+    for k, v in BUILDINGS.items()
+}
+
+# Flat lookup tables derived from the dictionaries above. The
+# calculator uses these in its loops so each value is a single
+# dictionary lookup, and building costs no longer mix in the
+# 'name' entry.
+RESOURCE_NAMES = {k: v["name"] for k, v in RESOURCES.items()}
+RESOURCE_UNITS = {k: v.get("unit", "units") for k, v in RESOURCES.items()}
+BUILDING_COSTS = {
+    k: tuple((res_key, qty) for res_key, qty in v.items() if res_key != "name")
+    for k, v in BUILDINGS.items()
+}
+
+# Row/column positions for the dense cost matrix. COST_MATRIX[b, r]
+# is how much of resource r one building b needs. It is only built
+# when NumPy is installed and is used for batch calculations.
+RESOURCE_INDEX = {k: i for i, k in enumerate(RESOURCES)}
+BUILDING_INDEX = {k: i for i, k in enumerate(BUILDINGS)}
+COST_MATRIX = None
+if _np is not None:
+    COST_MATRIX = _np.zeros((len(BUILDINGS), len(RESOURCES)), dtype=_np.int64)
+    for _bkey, _costs in BUILDING_COSTS.items():
+        for _res_key, _qty in _costs:
+            COST_MATRIX[BUILDING_INDEX[_bkey], RESOURCE_INDEX[_res_key]] = _qty
+
+
+# The demo project returned by sample_project().
+_SAMPLE_PROJECT = {
+    "duplicants": 3,
+    "days": 7,
+    "food_choice": "basic_meal",
+    "buildings": {"simple_bed": 3, "oxygen_generator": 1},
+}
+
 
 def sample_project():
     """Return a very small sample project dictionary for demo/testing.
 
     This is used by the demo code so we can run the module without
-    typing input during automated tests.
+    typing input during automated tests. Each call returns a fresh
+    copy, so changing the result does not affect later calls.
     """
-    return {
-        "duplicants": 3,
-        "days": 7,
-        "food_choice": "basic_meal",
-        "buildings": {"simple_bed": 3, "oxygen_generator": 1},
-    }
+    return {**_SAMPLE_PROJECT, "buildings": dict(_SAMPLE_PROJECT["buildings"])}
@@ -6,8 +6,10 @@ Functions include input parsing, table printing, and project
 save/load operations.
 """
 
+import sys
 import json
-from datetime import datetime
+import time
+from itertools import zip_longest
 
 
 def safe_int(prompt, default=None):
@@ -29,37 +31,47 @@ def safe_int(prompt, default=None):
 def print_table(rows, headers=None):
     """Print a table (list of rows) with optional headers.
 
-    Columns are aligned using basic string formatting.
+    Columns are aligned using basic string formatting. The whole
+    table is written to stdout with a single write call.
     """
     if not rows:
         print("(no rows)")
         return
 
-    # Compute column widths
-    cols = len(rows[0])
-    widths = [0] * cols
-    if headers:
-        for i, h in enumerate(headers):
-            widths[i] = max(widths[i], len(str(h)))
-    for r in rows:
-        for i, c in enumerate(r):
-            widths[i] = max(widths[i], len(str(c)))
+    # Turn every cell into a string once, then compute column widths
+    str_rows = [[str(c) for c in r] for r in rows]
+    str_headers = [str(h) for h in headers] if headers else None
+    all_rows = [str_headers] + str_rows if str_headers else str_rows
+    widths = [max(map(len, col)) for col in zip_longest(*all_rows, fillvalue="")]
+
+    lines = []
 
     # Header
-    if headers:
-        line = "  ".join(str(h).ljust(widths[i]) for i, h in enumerate(headers))
-        print(line)
-        print("-" * len(line))
+    if str_headers:
+        line = "  ".join(h.ljust(widths[i]) for i, h in enumerate(str_headers))
+        lines.append(line)
+        lines.append("-" * len(line))
 
     # Rows
-    for r in rows:
-        print("  ".join(str(c).ljust(widths[i]) for i, c in enumerate(r)))
+    for r in str_rows:
+        lines.append("  ".join(c.ljust(widths[i]) for i, c in enumerate(r)))
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def save_project(path, data):
-    """Save a project dictionary to a JSON file."""
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+def save_project(path, data, *, indent=2, compact=False):
+    """Save a project dictionary to a JSON file.
+
+    By default the file is indented so it is easy to read. Pass
+    compact=True to write it without extra whitespace. The JSON
+    text is built first and written in one call.
+    """
+    if compact:
+        payload = json.dumps(data, separators=(',', ':'))
+    else:
+        payload = json.dumps(data, indent=indent)
+    with open(path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        f.write(payload)
 
 
 def load_project(path):
@@ -70,4 +82,4 @@ def load_project(path):
 
 def time_stamp():
     """Return a short timestamp string for saving files and logs."""
-    return datetime.now().strftime('%Y%m%d_%H%M%S')
+    return time.strftime('%Y%m%d_%H%M%S')